@@ -1,152 +1,153 @@
-from typing import List, Dict, Optional, Union
+from itertools import count, islice
+from typing import List, Dict, Optional, Tuple, Union
 from fastapi import HTTPException, status
 
-from . import models, schemas
+from . import domain, schemas
 
-# In-memory storage
-fake_cats_db: Dict[int, models.Cat] = {}
-fake_missions_db: Dict[int, models.Mission] = {}
-fake_targets_db: Dict[int, models.Target] = {}
+# In-memory storage. Targets live on their mission (MissionRow.targets_by_id),
+# which is the authoritative store: lookup, membership and deletion all go
+# through one dict keyed by target id.
+fake_cats_db: Dict[int, domain.CatRow] = {}
+fake_missions_db: Dict[int, domain.MissionRow] = {}
 
-next_cat_id = 1
-next_mission_id = 1
-next_target_id = 1
+# Secondary index: (name, breed) -> cat_id, so the duplicate check in
+# create_cat is a single hash lookup instead of a scan over all cats.
+cats_by_name_breed: Dict[Tuple[str, str], int] = {}
+
+# Count of not-yet-complete targets per mission; mark_target_complete
+# decrements it to zero instead of re-scanning every target on each call.
+mission_open_targets: Dict[int, int] = {}
+
+# Id allocators: next() on a count iterator is a single C call, with no
+# global load/add/store per insert.
+_cat_ids = count(1)
+_mission_ids = count(1)
+_target_ids = count(1)
 
 # Helper to reset DB for testing or re-runs if needed (not for production)
 async def reset_db_state():
-    global fake_cats_db, fake_missions_db, fake_targets_db
-    global next_cat_id, next_mission_id, next_target_id
+    global fake_cats_db, fake_missions_db, cats_by_name_breed
+    global mission_open_targets
+    global _cat_ids, _mission_ids, _target_ids
     fake_cats_db = {}
     fake_missions_db = {}
-    fake_targets_db = {}
-    next_cat_id = 1
-    next_mission_id = 1
-    next_target_id = 1
+    cats_by_name_breed = {}
+    mission_open_targets = {}
+    _cat_ids = count(1)
+    _mission_ids = count(1)
+    _target_ids = count(1)
 
 # --- Spy Cats CRUD ---
-async def create_cat(cat_in: schemas.CatCreate) -> models.Cat:
-    global next_cat_id
-    if any(existing_cat.name == cat_in.name and existing_cat.breed == cat_in.breed for existing_cat in fake_cats_db.values()):
+async def create_cat(cat_in: schemas.CatCreate) -> domain.CatRow:
+    if (cat_in.name, cat_in.breed) in cats_by_name_breed:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A cat with the same name and breed already exists.")
-    
-    db_cat = models.Cat(
-        id=next_cat_id,
+
+    cat_id = next(_cat_ids)
+    db_cat = domain.CatRow(
+        id=cat_id,
         name=cat_in.name,
         years_of_experience=cat_in.years_of_experience,
         breed=cat_in.breed,
         salary=cat_in.salary,
         mission_id=None
     )
-    fake_cats_db[next_cat_id] = db_cat
-    next_cat_id += 1
+    fake_cats_db[cat_id] = db_cat
+    cats_by_name_breed[(db_cat.name, db_cat.breed)] = cat_id
     return db_cat
 
-async def get_cat(cat_id: int) -> Optional[models.Cat]:
+def get_cat(cat_id: int) -> Optional[domain.CatRow]:
     return fake_cats_db.get(cat_id)
 
-async def get_cats(skip: int = 0, limit: int = 100) -> List[models.Cat]:
-    return list(fake_cats_db.values())[skip : skip + limit]
+def get_cats(skip: int = 0, limit: int = 100) -> List[domain.CatRow]:
+    # islice streams only the requested window instead of copying the whole
+    # dict; clamp to zero since islice rejects negative indices
+    skip, limit = max(skip, 0), max(limit, 0)
+    return list(islice(fake_cats_db.values(), skip, skip + limit))
 
-async def update_cat_salary(cat_id: int, salary: float) -> Optional[models.Cat]:
+async def update_cat_salary(cat_id: int, salary: float) -> Optional[domain.CatRow]:
     if cat_id not in fake_cats_db:
         return None
     fake_cats_db[cat_id].salary = salary
     return fake_cats_db[cat_id]
 
-async def delete_cat(cat_id: int) -> Optional[models.Cat]:
+async def delete_cat(cat_id: int) -> Optional[domain.CatRow]:
     # Check if cat is on a mission
-    if cat_id in fake_cats_db and fake_cats_db[cat_id].mission_id is not None:
-        mission = await get_mission(fake_cats_db[cat_id].mission_id)
+    cat = fake_cats_db.get(cat_id)
+    if cat is not None and cat.mission_id is not None:
+        mission = fake_missions_db.get(cat.mission_id)
         if mission and not mission.is_complete:
              raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete cat assigned to an active mission.")
 
-    return fake_cats_db.pop(cat_id, None)
+    deleted_cat = fake_cats_db.pop(cat_id, None)
+    if deleted_cat is not None:
+        cats_by_name_breed.pop((deleted_cat.name, deleted_cat.breed), None)
+    return deleted_cat
 
 # --- Missions / Targets CRUD ---
 
-async def create_mission(mission_in: schemas.MissionCreate) -> models.Mission:
-    global next_mission_id, next_target_id
-    
-    db_targets = []
+async def create_mission(mission_in: schemas.MissionCreate) -> domain.MissionRow:
+    db_targets = {}
     for target_in in mission_in.targets:
-        db_target = models.Target(
-            id=next_target_id,
+        target_id = next(_target_ids)
+        db_targets[target_id] = domain.TargetRow(
+            id=target_id,
             name=target_in.name,
             country=target_in.country,
             notes=target_in.notes,
             is_complete=False
         )
-        fake_targets_db[next_target_id] = db_target
-        db_targets.append(db_target)
-        next_target_id += 1
 
-    db_mission = models.Mission(
-        id=next_mission_id,
-        targets=db_targets,
+    mission_id = next(_mission_ids)
+    db_mission = domain.MissionRow(
+        id=mission_id,
+        targets_by_id=db_targets,
         is_complete=False,
         cat_id=None # Initially unassigned
     )
-    fake_missions_db[next_mission_id] = db_mission
-    next_mission_id += 1
+    fake_missions_db[mission_id] = db_mission
+    mission_open_targets[mission_id] = len(db_targets)
     return db_mission
 
-async def get_mission(mission_id: int) -> Optional[models.Mission]:
-    mission = fake_missions_db.get(mission_id)
-    if not mission: 
-        return None
-    # Ensure targets are correctly populated from fake_targets_db if they were just IDs
-    # In our current model structure, Mission directly holds Target objects, 
-    # so this step might be redundant if create_mission populates it fully.
-    # However, if Mission only stored target_ids, this would be crucial.
-    # For consistency with how we might fetch from a real DB:
-    fetched_targets = []
-    for target_model in mission.targets: # mission.targets should hold full Target models
-        if target_model.id in fake_targets_db:
-            fetched_targets.append(fake_targets_db[target_model.id])
-    mission.targets = fetched_targets
-    return mission
+def get_mission(mission_id: int) -> Optional[domain.MissionRow]:
+    return fake_missions_db.get(mission_id)
 
-async def get_missions(skip: int = 0, limit: int = 100) -> List[models.Mission]:
-    missions = list(fake_missions_db.values())[skip : skip + limit]
-    # Similar to get_mission, ensure targets are fresh
-    for mission in missions:
-        fetched_targets = []
-        for target_model in mission.targets:
-            if target_model.id in fake_targets_db:
-                fetched_targets.append(fake_targets_db[target_model.id])
-        mission.targets = fetched_targets
-    return missions
-
-async def assign_cat_to_mission(mission_id: int, cat_id: int) -> Optional[models.Mission]:
-    mission = await get_mission(mission_id)
-    cat = await get_cat(cat_id)
+def get_missions(skip: int = 0, limit: int = 100) -> List[domain.MissionRow]:
+    skip, limit = max(skip, 0), max(limit, 0)
+    return list(islice(fake_missions_db.values(), skip, skip + limit))
+
+async def assign_cat_to_mission(mission_id: int, cat_id: int) -> Optional[domain.MissionRow]:
+    mission = fake_missions_db.get(mission_id)
+    cat = fake_cats_db.get(cat_id)
 
     if not mission:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Mission with id {mission_id} not found")
     if not cat:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Cat with id {cat_id} not found")
 
+    if mission.is_complete:
+        # Also keeps the invariant below honest: a cat can never end up
+        # pointing at a completed mission.
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Mission {mission_id} is already complete and cannot be assigned.")
     if mission.cat_id is not None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Mission {mission_id} is already assigned to cat {mission.cat_id}")
     if cat.mission_id is not None:
-        # Check if the assigned mission is actually active
-        assigned_mission = await get_mission(cat.mission_id)
-        if assigned_mission and not assigned_mission.is_complete:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Cat {cat_id} is already on an active mission {cat.mission_id}")
+        # mark_target_complete clears cat.mission_id when a mission completes,
+        # so a non-None mission_id always means an active mission.
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Cat {cat_id} is already on an active mission {cat.mission_id}")
 
     mission.cat_id = cat_id
     cat.mission_id = mission_id
     return mission
 
-async def update_target_notes(mission_id: int, target_id: int, notes: str) -> Optional[models.Target]:
-    mission = await get_mission(mission_id)
+async def update_target_notes(mission_id: int, target_id: int, notes: str) -> Optional[domain.TargetRow]:
+    mission = get_mission(mission_id)
     if not mission:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Mission {mission_id} not found.")
     if mission.is_complete:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot update notes on a completed mission.")
 
-    target = fake_targets_db.get(target_id)
-    if not target or target not in mission.targets:
+    target = mission.targets_by_id.get(target_id)
+    if target is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Target {target_id} not found in mission {mission_id}.")
     if target.is_complete:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot update notes on a completed target.")
@@ -154,49 +155,47 @@ async def update_target_notes(mission_id: int, target_id: int, notes: str) -> Op
     target.notes = notes
     return target
 
-async def mark_target_complete(mission_id: int, target_id: int) -> Optional[models.Target]:
-    mission = await get_mission(mission_id)
+async def mark_target_complete(mission_id: int, target_id: int) -> Optional[domain.TargetRow]:
+    mission = get_mission(mission_id)
     if not mission:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Mission {mission_id} not found.")
     # Cannot mark target complete if mission is already complete (though this state should be derived)
     if mission.is_complete:
          raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Mission is already complete. Cannot modify targets.")
 
-    target = fake_targets_db.get(target_id)
-    if not target or target not in mission.targets:
+    target = mission.targets_by_id.get(target_id)
+    if target is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Target {target_id} not found in mission {mission_id}.")
-    
+
     if target.is_complete:
         # Idempotency: if already complete, just return the target
         return target
 
     target.is_complete = True
-    
-    # Check if all targets in the mission are complete
-    all_targets_complete = all(t.is_complete for t in mission.targets)
-    if all_targets_complete:
+
+    # Mission is complete once its last open target is done
+    mission_open_targets[mission_id] -= 1
+    if mission_open_targets[mission_id] == 0:
         mission.is_complete = True
         # If mission is complete, the cat is now free
-        if mission.cat_id and mission.cat_id in fake_cats_db:
-            fake_cats_db[mission.cat_id].mission_id = None
+        cat = fake_cats_db.get(mission.cat_id) if mission.cat_id else None
+        if cat is not None:
+            cat.mission_id = None
             
     return target
 
-async def delete_mission(mission_id: int) -> Optional[models.Mission]:
-    mission = await get_mission(mission_id)
+async def delete_mission(mission_id: int) -> Optional[domain.MissionRow]:
+    mission = get_mission(mission_id)
     if not mission:
         return None # Or raise 404 if preferred for delete operations
 
     if mission.cat_id is not None:
         # Check if the cat is still assigned *and* mission is not complete
         # If mission is complete, cat should have been unassigned.
-        cat = await get_cat(mission.cat_id)
+        cat = get_cat(mission.cat_id)
         if cat and cat.mission_id == mission_id and not mission.is_complete:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete a mission that is currently assigned to a cat and is not complete.")
 
-    # Delete associated targets first to maintain consistency
-    for target in list(mission.targets): # Iterate over a copy
-        fake_targets_db.pop(target.id, None)
-    
-    # Then delete the mission
+    # Targets live on the mission row, so they are dropped with it
+    mission_open_targets.pop(mission_id, None)
     return fake_missions_db.pop(mission_id, None) 
\ No newline at end of file
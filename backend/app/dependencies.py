@@ -1,3 +1,7 @@
+import asyncio
+import time
+from typing import FrozenSet, Optional
+
 import httpx
 from fastapi import HTTPException, status, Depends
 
@@ -6,6 +10,59 @@ from .schemas import CatCreate # Assuming CatCreate is in schemas.py
 
 THECATAPI_URL = "https://api.thecatapi.com/v1/breeds"
 
+# One shared client for all outbound calls: keep-alive connections mean we pay
+# the TCP/TLS handshake once, not on every breed validation. Closed on app
+# shutdown via close_http_client() in main.lifespan.
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+# Breed list changes rarely; cache the lowercased names in-process so that
+# breed validation is one HTTP GET per hour instead of one per cat creation.
+BREED_CACHE_TTL_SECONDS = 3600.0
+
+_valid_breeds: FrozenSet[str] = frozenset()
+_breed_cache_expires: float = 0.0
+# Guards only the refresh; readers never take it (double-checked locking).
+_breed_refresh_lock = asyncio.Lock()
+
+async def _get_valid_breeds() -> FrozenSet[str]:
+    """
+    Returns the cached set of lowercased breed names, refreshing it from
+    TheCatAPI when the TTL has expired. httpx errors propagate to the caller.
+
+    The unlocked fast path is safe: the frozenset is replaced by a single
+    reference assignment, so concurrent readers see either the old or the
+    new snapshot, never a partial one.
+    """
+    global _valid_breeds, _breed_cache_expires
+    if time.monotonic() < _breed_cache_expires:
+        return _valid_breeds
+    async with _breed_refresh_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() < _breed_cache_expires:
+            return _valid_breeds
+        response = await get_http_client().get(THECATAPI_URL)
+        response.raise_for_status()
+        breeds_data = response.json()
+        # Immutable snapshot: concurrent readers can share it without locking
+        _valid_breeds = frozenset(b["name"].lower() for b in breeds_data)
+        _breed_cache_expires = time.monotonic() + BREED_CACHE_TTL_SECONDS
+        return _valid_breeds
+
 async def validate_cat_breed_from_payload(cat_create_payload: CatCreate) -> CatCreate:
     """
     Validates the cat breed from the CatCreate payload using TheCatAPI.
@@ -14,41 +71,39 @@ async def validate_cat_breed_from_payload(cat_create_payload: CatCreate) -> CatC
     If valid, it returns the original payload; otherwise, raises HTTPException.
     """
     breed_to_validate = cat_create_payload.breed
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(THECATAPI_URL)
-            response.raise_for_status()
-            breeds_data = response.json()
-            if not any(b["name"].lower() == breed_to_validate.lower() for b in breeds_data):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid cat breed: '{breed_to_validate}'. Breed not found in TheCatAPI."
-                )
-            # If validation passes, return the original payload for the endpoint to use
-            return cat_create_payload
-        except httpx.RequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"TheCatAPI service unavailable, could not validate breed: {exc}"
-            )
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Error from TheCatAPI ({exc.response.status_code}) while validating breed: {exc.response.text}"
-            )
-        except Exception as e:
+    try:
+        valid_breeds = await _get_valid_breeds()
+        if breed_to_validate.lower() not in valid_breeds:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"An unexpected error occurred during breed validation: {str(e)}"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid cat breed: '{breed_to_validate}'. Breed not found in TheCatAPI."
             )
+        # If validation passes, return the original payload for the endpoint to use
+        return cat_create_payload
+    except httpx.RequestError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"TheCatAPI service unavailable, could not validate breed: {exc}"
+        )
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Error from TheCatAPI ({exc.response.status_code}) while validating breed: {exc.response.text}"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred during breed validation: {str(e)}"
+        )
 
 # Optional: A simpler function to just get breeds if needed elsewhere
 async def get_thecatapi_breeds() -> list:
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(THECATAPI_URL)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            # Simplified error handling for a getter; specific exceptions handled above
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Could not fetch breeds: {str(e)}") 
\ No newline at end of file
+    try:
+        response = await get_http_client().get(THECATAPI_URL)
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        # Simplified error handling for a getter; specific exceptions handled above
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Could not fetch breeds: {str(e)}") 
\ No newline at end of file
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Plain dataclass rows for the in-memory store. Unlike the Pydantic wire
+# schemas in models.py, these use __slots__ (compact layout) and plain
+# attribute writes with no validation machinery on the hot mutation paths.
+# The Pydantic response models read them back via from_attributes=True.
+
+@dataclass(slots=True)
+class TargetRow:
+    id: int
+    name: str
+    country: str
+    notes: Optional[str] = None
+    is_complete: bool = False
+
+@dataclass(slots=True)
+class MissionRow:
+    id: int
+    # The mission owns its targets; lookup by id is a single dict.get
+    targets_by_id: Dict[int, TargetRow] = field(default_factory=dict)
+    is_complete: bool = False
+    cat_id: Optional[int] = None
+
+    @property
+    def targets(self) -> List[TargetRow]:
+        # List view for the wire schema (schemas.Mission.targets)
+        return list(self.targets_by_id.values())
+
+@dataclass(slots=True)
+class CatRow:
+    id: int
+    name: str
+    years_of_experience: int
+    breed: str
+    salary: float
+    mission_id: Optional[int] = None
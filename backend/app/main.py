@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from .routers import cats, missions
 from . import crud # For reset_db_state, if used
+from .dependencies import close_http_client
 
 # Lifespan context manager for startup/shutdown events
 @asynccontextmanager
@@ -14,6 +15,7 @@ async def lifespan(current_app: FastAPI):
     print("In-memory database has been reset.")
     yield
     # Shutdown
+    await close_http_client() # Release the shared outbound HTTP client
     print("Spy Cat Agency API shutting down...")
 
 app = FastAPI(
@@ -40,15 +42,8 @@ app.add_middleware(
     allow_headers=["*"],    # Allow all headers
 )
 
-print(f"DEBUG: cats module is {cats}")
-print(f"DEBUG: cats.router is {getattr(cats, 'router', 'not found')}")
 app.include_router(cats.router, prefix="/cats", tags=["Spy Cats"])
-print("DEBUG: Cats router included.")
-
-print(f"DEBUG: missions module is {missions}")
-print(f"DEBUG: missions.router is {getattr(missions, 'router', 'not found')}")
 app.include_router(missions.router, prefix="/missions", tags=["Missions & Targets"])
-print("DEBUG: Missions router included.")
 
 @app.get("/", tags=["Root"], summary="Root path for the API")
 async def read_root():
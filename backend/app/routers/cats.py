@@ -27,12 +27,12 @@ async def create_spy_cat(
 @router.get("/", response_model=List[schemas.Cat])
 async def list_spy_cats(skip: int = 0, limit: int = 100):
     """List all spy cats."""
-    return await crud.get_cats(skip=skip, limit=limit)
+    return crud.get_cats(skip=skip, limit=limit)
 
 @router.get("/{cat_id}", response_model=schemas.Cat)
 async def get_spy_cat(cat_id: int):
     """Get a single spy cat by ID."""
-    db_cat = await crud.get_cat(cat_id=cat_id)
+    db_cat = crud.get_cat(cat_id=cat_id)
     if db_cat is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Spy cat not found")
     return db_cat
@@ -23,12 +23,12 @@ async def create_new_mission(mission_in: schemas.MissionCreate):
 @router.get("/", response_model=List[schemas.Mission])
 async def list_all_missions(skip: int = 0, limit: int = 100):
     """List all missions."""
-    return await crud.get_missions(skip=skip, limit=limit)
+    return crud.get_missions(skip=skip, limit=limit)
 
 @router.get("/{mission_id}", response_model=schemas.Mission)
 async def get_single_mission(mission_id: int):
     """Get a single mission by ID."""
-    db_mission = await crud.get_mission(mission_id=mission_id)
+    db_mission = crud.get_mission(mission_id=mission_id)
     if db_mission is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mission not found")
     return db_mission